@@ -171,6 +171,16 @@ DEBUG_MODE = False
 # Cache timeout (seconds) - how long to cache data before reloading
 CACHE_TIMEOUT = 3600  # 1 hour (matches @st.cache_data ttl in data_loader.py)
 
+# Local disk cache for raw vacuum sheet data (survives app restarts).
+# Personnel data is never cached on disk — it includes pay rates.
+# Files are reused until the sheet's Drive modifiedTime changes; if that
+# can't be read, files older than CACHE_TIMEOUT are ignored and re-fetched.
+DISK_CACHE_DIR = '.cache'
+
+# Max concurrent Google Sheets reads per spreadsheet (keeps us well inside
+# the Sheets API quota of 100 requests per 100 seconds per user)
+SHEETS_MAX_WORKERS = 8
+
 # Maximum number of rows to display in tables
 MAX_TABLE_ROWS = 100
 
@@ -21,7 +21,8 @@ import config
 from data_loader import (
     load_all_vacuum_data, load_all_personnel_data, load_repairs_tracker,
     load_approved_personnel, merge_approved_data,
-    process_vacuum_data, process_personnel_data
+    process_vacuum_data, process_personnel_data, clear_disk_cache,
+    run_concurrently
 )
 
 # Import utility functions
@@ -267,6 +268,7 @@ def render_sidebar():
             if st.button("🔄 Vacuum", use_container_width=True, help="Refresh vacuum sensor data only"):
                 load_all_vacuum_data.clear()
                 process_vacuum_data.clear()
+                clear_disk_cache('vacuum')
                 st.rerun()
         with col_ref2:
             if st.button("🔄 Personnel", use_container_width=True, help="Refresh personnel/TSheets data only"):
@@ -376,14 +378,18 @@ def load_data(days_to_load):
     # Load data with progress indication
     with st.spinner('Loading data from Google Sheets...'):
         try:
-            vacuum_df = load_all_vacuum_data(ny_vacuum_url, vt_vacuum_url, credentials, days=days_to_load)
-            personnel_df = load_all_personnel_data(personnel_url, credentials)
-            repairs_df = load_repairs_tracker(personnel_url, credentials)
+            # The four loads are independent, so fetch them concurrently
+            # (only matters on a cold cache — cached loads return instantly).
+            vacuum_df, personnel_df, repairs_df, approved_df = run_concurrently(
+                lambda: load_all_vacuum_data(ny_vacuum_url, vt_vacuum_url, credentials, days=days_to_load),
+                lambda: load_all_personnel_data(personnel_url, credentials),
+                lambda: load_repairs_tracker(personnel_url, credentials),
+                lambda: load_approved_personnel(personnel_url, credentials),
+            )
 
             # Merge manager-approved overrides into personnel data.
             # Where the manager has corrected a row (same Employee+Date+Job),
             # use the corrected version.  All data is shown on all pages.
-            approved_df = load_approved_personnel(personnel_url, credentials)
             personnel_df = merge_approved_data(personnel_df, approved_df)
 
         except Exception as e:
@@ -15,14 +15,17 @@ import streamlit as st
 import pandas as pd
 from datetime import datetime, timedelta
 from utils import find_column
-import gspread
-from google.oauth2.service_account import Credentials
+from data_loader import connect_to_sheets
 
 
 def detect_repairs_needed(personnel_df):
     """
     Detect entries where "Repairs needed" field has content
     
+    The field is normally a numeric count, so any non-zero count is flagged
+    and a zero count (0 or 0.0) never is. Non-numeric text is flagged when
+    it isn't blank.
+    
     Returns: DataFrame with alerts
     """
     alerts = []
@@ -39,12 +42,13 @@ def detect_repairs_needed(personnel_df):
     if not all([emp_col, date_col, repairs_col]):
         return pd.DataFrame(alerts)
     
-    # Filter to records with repairs needed
-    repairs_df = personnel_df[
-        personnel_df[repairs_col].notna() & 
-        (personnel_df[repairs_col].astype(str).str.strip() != '') &
-        (personnel_df[repairs_col].astype(str).str.strip() != '0')
-    ].copy()
+    # Filter to records with repairs needed. Compare counts numerically so
+    # the result doesn't depend on the column dtype (a float zero
+    # stringifies as '0.0', an int zero as '0').
+    repairs = personnel_df[repairs_col]
+    counts = pd.to_numeric(repairs, errors='coerce')
+    has_text = counts.isna() & repairs.notna() & (repairs.astype(str).str.strip() != '')
+    repairs_df = personnel_df[counts.fillna(0).ne(0) | has_text].copy()
     
     for _, record in repairs_df.iterrows():
         employee = record[emp_col]
@@ -420,21 +424,8 @@ def load_manager_notes(sheet_url, credentials_path):
     Returns: DataFrame with notes
     """
     try:
-        # Set up credentials
-        scopes = [
-            'https://www.googleapis.com/auth/spreadsheets',
-            'https://www.googleapis.com/auth/drive'
-        ]
-        
-        # Try to load from Streamlit secrets first (for cloud deployment)
-        try:
-            credentials_dict = st.secrets["gcp_service_account"]
-            creds = Credentials.from_service_account_info(credentials_dict, scopes=scopes)
-        except Exception:
-            # Fall back to local credentials file
-            creds = Credentials.from_service_account_file(credentials_path, scopes=scopes)
-        
-        client = gspread.authorize(creds)
+        # Shared, cached client (secrets first, then local credentials file)
+        client = connect_to_sheets(credentials_path)
         
         # Open the personnel sheet (we'll add notes tab there)
         sheet = client.open_by_url(sheet_url)
@@ -451,9 +442,12 @@ def load_manager_notes(sheet_url, credentials_path):
                 'Manager', 'Note', 'Status'
             ]])
         
-        # Get all data
-        data = worksheet.get_all_records()
-        return pd.DataFrame(data)
+        # Get all data (raw values; skips get_all_records' per-row dict building)
+        raw = worksheet.get_all_values()
+        if len(raw) <= 1:
+            return pd.DataFrame()
+        rows = [r for r in raw[1:] if r.count('') != len(r)]
+        return pd.DataFrame(rows, columns=raw[0])
     
     except Exception as e:
         st.error(f"Error loading manager notes: {str(e)}")
@@ -468,20 +462,8 @@ def save_manager_note(sheet_url, credentials_path, note_data):
         note_data: dict with keys: Date, Employee, Issue, Severity, Manager, Note, Status
     """
     try:
-        # Set up credentials
-        scopes = [
-            'https://www.googleapis.com/auth/spreadsheets',
-            'https://www.googleapis.com/auth/drive'
-        ]
-        
-        # Try to load from Streamlit secrets first
-        try:
-            credentials_dict = st.secrets["gcp_service_account"]
-            creds = Credentials.from_service_account_info(credentials_dict, scopes=scopes)
-        except Exception:
-            creds = Credentials.from_service_account_file(credentials_path, scopes=scopes)
-        
-        client = gspread.authorize(creds)
+        # Shared, cached client (secrets first, then local credentials file)
+        client = connect_to_sheets(credentials_path)
         sheet = client.open_by_url(sheet_url)
         worksheet = sheet.worksheet('Alerts_Notes')
         
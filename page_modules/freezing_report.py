@@ -14,7 +14,8 @@ from plotly.subplots import make_subplots
 
 import config
 from utils import (
-    find_column, get_vacuum_column, extract_conductor_system
+    find_column, get_vacuum_column, extract_conductor_system,
+    latest_reading_per_sensor,
 )
 from utils.helpers import get_releaser_column
 from utils.freeze_thaw import get_current_freeze_thaw_status, render_freeze_thaw_banner
@@ -94,7 +95,7 @@ def render(vacuum_df, personnel_df):
     vdf['Conductor'] = vdf[sensor_col].apply(extract_conductor_system)
 
     # Get latest reading per sensor
-    latest = vdf.sort_values(timestamp_col, ascending=False).groupby(sensor_col).first().reset_index()
+    latest = latest_reading_per_sensor(vdf, sensor_col, timestamp_col)
 
     # ── Filter out stale sensors (>24h since last reading) ────────
     now = vdf[timestamp_col].max()
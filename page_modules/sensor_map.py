@@ -9,7 +9,7 @@ import pandas as pd
 import folium
 from streamlit_folium import st_folium
 import config
-from utils import find_column, get_vacuum_column, match_mainline_to_sensor
+from utils import find_column, get_vacuum_column, match_mainline_to_sensor, latest_reading_per_sensor
 from utils.freeze_thaw import get_current_freeze_thaw_status, detect_freeze_event_drops
 import re
 import math
@@ -165,7 +165,7 @@ def render(vacuum_df, personnel_df, repairs_df=None):
     if timestamp_col:
         temp_df = vacuum_df.copy()
         temp_df[timestamp_col] = pd.to_datetime(temp_df[timestamp_col], errors='coerce')
-        latest = temp_df.sort_values(timestamp_col, ascending=False).groupby(sensor_col).first().reset_index()
+        latest = latest_reading_per_sensor(temp_df, sensor_col, timestamp_col)
     else:
         latest = vacuum_df.groupby(sensor_col).first().reset_index()
 
@@ -11,7 +11,10 @@ import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 from datetime import timedelta
 import config
-from utils import find_column, get_vacuum_column, get_releaser_column, extract_conductor_system
+from utils import (
+    find_column, get_vacuum_column, get_releaser_column, extract_conductor_system,
+    latest_reading_per_sensor,
+)
 from utils.freeze_thaw import (
     get_current_freeze_thaw_status,
     detect_freeze_event_drops,
@@ -538,7 +541,7 @@ def render(vacuum_df, personnel_df):
     if timestamp_col in vacuum_df.columns:
         temp_df = vacuum_df.copy()
         temp_df[timestamp_col] = pd.to_datetime(temp_df[timestamp_col], errors='coerce')
-        latest = temp_df.sort_values(timestamp_col, ascending=False).groupby(sensor_col).first().reset_index()
+        latest = latest_reading_per_sensor(temp_df, sensor_col, timestamp_col)
     else:
         latest = vacuum_df.groupby(sensor_col).first().reset_index()
 
@@ -854,7 +857,7 @@ def _render_freezing_report(vacuum_df):
         return
 
     # Latest reading per sensor
-    latest = vdf.sort_values(timestamp_col, ascending=False).groupby(sensor_col).first().reset_index()
+    latest = latest_reading_per_sensor(vdf, sensor_col, timestamp_col)
 
     # ── Separate stale sensors (>24h since last reading) ──────────────
     now = vdf[timestamp_col].max()
@@ -0,0 +1,6 @@
+import os
+import sys
+
+# Make the dashboard's top-level modules (config, data_loader, utils,
+# page_modules) importable when pytest is run from any directory
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,34 @@
+"""
+Tests for data_loader parsing helpers
+"""
+
+import pandas as pd
+
+from data_loader import _parse_mixed_timestamps
+
+
+def test_excel_serial_on_the_hour_parses_exactly():
+    parsed = _parse_mixed_timestamps(pd.Series([45658 + 1 / 24], dtype=object))
+
+    assert parsed.iloc[0] == pd.Timestamp('2025-01-01 01:00:00')
+
+
+def test_excel_serials_keep_their_hour_and_minute():
+    # Every 7 minutes across one day, as the vacuum scraper writes them
+    minutes = range(0, 24 * 60, 7)
+    serials = pd.Series([45658 + m / 1440 for m in minutes], dtype=object)
+
+    parsed = _parse_mixed_timestamps(serials)
+
+    expected = pd.Timestamp('2025-01-01') + pd.to_timedelta(list(minutes), unit='min')
+    assert parsed.tolist() == list(expected)
+
+
+def test_mixed_serials_and_text_timestamps():
+    values = pd.Series([45658.5, '2025-01-02 07:30:00', ''], dtype=object)
+
+    parsed = _parse_mixed_timestamps(values)
+
+    assert parsed.iloc[0] == pd.Timestamp('2025-01-01 12:00:00')
+    assert parsed.iloc[1] == pd.Timestamp('2025-01-02 07:30:00')
+    assert pd.isna(parsed.iloc[2])
@@ -0,0 +1,42 @@
+"""
+Tests for the data quality alert detectors
+"""
+
+import pandas as pd
+import pytest
+
+from page_modules.data_quality import detect_repairs_needed
+
+
+def _personnel(repairs):
+    return pd.DataFrame({
+        'Employee Name': [f'Emp {i}' for i in range(len(repairs))],
+        'Date': pd.Timestamp('2025-03-01'),
+        'Repairs needed': repairs,
+        'mainline': 'A1',
+        'Site': 'NY',
+    })
+
+
+@pytest.mark.parametrize('repairs', [
+    pd.Series([0, 2, 0], dtype='int32'),
+    pd.Series([0.0, 2.0, 0.0], dtype='float64'),
+    pd.Series(['0', '2', '0.0'], dtype=object),
+])
+def test_zero_repair_counts_are_not_flagged(repairs):
+    alerts = detect_repairs_needed(_personnel(repairs))
+
+    assert alerts['Employee'].tolist() == ['Emp 1']
+
+
+def test_blank_and_missing_repairs_are_not_flagged():
+    alerts = detect_repairs_needed(_personnel(pd.Series(['', '  ', None], dtype=object)))
+
+    assert alerts.empty
+
+
+def test_free_text_repairs_are_flagged():
+    alerts = detect_repairs_needed(_personnel(pd.Series(['leak at A1', '', 0], dtype=object)))
+
+    assert alerts['Employee'].tolist() == ['Emp 0']
+    assert alerts['Repair_Note'].tolist() == ['leak at A1']
@@ -6,6 +6,7 @@ Reusable helper functions for the dashboard
 from .helpers import (
     find_column,
     filter_recent_sensors,
+    latest_reading_per_sensor,
     format_hours,
     format_vacuum,
     format_percentage,
@@ -43,6 +44,7 @@ __all__ = [
     'get_vacuum_column',
     'get_releaser_column',
     'filter_recent_sensors',
+    'latest_reading_per_sensor',
     'format_hours',
     'format_vacuum',
     'format_percentage',
@@ -96,14 +96,12 @@ def find_problem_clusters(vacuum_df, distance_threshold=500, min_sensors=2, vacu
     
     problem_sensors['cluster'] = clustering.labels_
     
-    # Extract cluster information (ignore noise points, labeled as -1)
+    # Extract cluster information (ignore noise points, labeled as -1).
+    # One groupby pass splits the sensors instead of re-filtering the whole
+    # frame once per cluster.
+    clustered = problem_sensors[problem_sensors['cluster'] != -1]
     clusters = []
-    for cluster_id in problem_sensors['cluster'].unique():
-        if cluster_id == -1:  # Skip noise points
-            continue
-        
-        cluster_data = problem_sensors[problem_sensors['cluster'] == cluster_id]
-        
+    for cluster_id, cluster_data in clustered.groupby('cluster', sort=False):
         # Calculate cluster statistics
         cluster_info = {
             'cluster_id': cluster_id,
@@ -137,19 +135,18 @@ def calculate_cluster_spread(cluster_sensors):
     if len(cluster_sensors) < 2:
         return 0
     
-    max_distance = 0
+    # All pairwise haversine distances at once (N x N broadcast) instead of
+    # one Python haversine_distance call per pair
+    lat = np.radians([sensor['lat'] for sensor in cluster_sensors])
+    lon = np.radians([sensor['lon'] for sensor in cluster_sensors])
+    dlat = lat[:, None] - lat[None, :]
+    dlon = lon[:, None] - lon[None, :]
+    a = np.sin(dlat / 2) ** 2 + np.cos(lat)[:, None] * np.cos(lat)[None, :] * np.sin(dlon / 2) ** 2
+    # Clip guards against rounding pushing a just past 1 for antipodal points
+    c = 2 * np.arcsin(np.sqrt(np.clip(a, 0, 1)))
     
-    for i in range(len(cluster_sensors)):
-        for j in range(i + 1, len(cluster_sensors)):
-            distance = haversine_distance(
-                cluster_sensors[i]['lat'],
-                cluster_sensors[i]['lon'],
-                cluster_sensors[j]['lat'],
-                cluster_sensors[j]['lon']
-            )
-            max_distance = max(max_distance, distance)
-    
-    return max_distance
+    # Radius of earth in meters
+    return float(c.max() * 6371000)
 
 
 def get_map_bounds(sensors):
@@ -107,6 +107,38 @@ def filter_recent_sensors(vacuum_df, days=2):
 
 
 
+def latest_reading_per_sensor(vacuum_df, sensor_col, timestamp_col):
+    """
+    Get the latest reading per sensor
+    
+    Same result as sort_values(timestamp_col, ascending=False)
+    .groupby(sensor_col).first().reset_index(), but the newest row per
+    sensor is found with one groupby idxmax pass instead of sorting the
+    whole frame. Falls back to the sort when timestamps are missing, or when
+    a newest row has blanks that first() would fill from an older reading.
+    
+    Args:
+        vacuum_df: Vacuum data DataFrame
+        sensor_col: Sensor name column
+        timestamp_col: Datetime column to order readings by
+        
+    Returns:
+        DataFrame with one row per sensor
+    """
+    if not vacuum_df.empty and vacuum_df[timestamp_col].notna().all():
+        latest = vacuum_df.loc[vacuum_df.groupby(sensor_col)[timestamp_col].idxmax()]
+        gaps = latest.isna().to_numpy()
+        if gaps.any():
+            # Blanks only matter if an older reading of that sensor has a value
+            has_value = vacuum_df.notna().groupby(vacuum_df[sensor_col]).any().to_numpy()
+            gaps = gaps & has_value
+        if not gaps.any():
+            columns = [sensor_col] + [c for c in vacuum_df.columns if c != sensor_col]
+            return latest[columns].reset_index(drop=True)
+    
+    return vacuum_df.sort_values(timestamp_col, ascending=False).groupby(sensor_col).first().reset_index()
+
+
 def format_hours(hours):
     """Format hours for display"""
     if pd.isna(hours):